@@ -14,31 +14,22 @@ import time
 import json
 import sqlalchemy
 from urllib.parse import urljoin
-from urllib.request import Request
-from urllib.request import urlopen
 
 from ochazuke import create_app
 from ochazuke.models import db
 from ochazuke.models import DailyTotal
+from tools.helpers import get_remote_data
 
 # Config
 SEARCH_URL = "https://api.github.com/search/"
 QUERY = "issues?q=repo:webcompat/web-bugs+created:{yesterday}"
+GITHUB_ACCEPT = "application/vnd.github.v3+json"
 LOGGER = logging.getLogger(__name__)
 
 
-def get_remote_file(url):
-    """Request URL."""
-    req = Request(url)
-    req.add_header("User-agent", "webcompatMonitor")
-    req.add_header("Accept", "application/vnd.github.v3+json")
-    json_response = urlopen(req, timeout=240)
-    return json_response
-
-
 def get_issue_count(json_response):
     """Get the number of issues (open or closed)."""
-    json_data = json.load(json_response)
+    json_data = json.loads(json_response)
     if not json_data["incomplete_results"]:
         return json_data["total_count"]
     else:
@@ -54,11 +45,12 @@ def main():
     # Insert yesterday's date into search query in format: 2019-01-30
     query = QUERY.format(yesterday=yesterday)
     url = urljoin(SEARCH_URL, query)
-    json_response = get_remote_file(url)
+    json_response = get_remote_data(url, accept=GITHUB_ACCEPT)
     issue_count = get_issue_count(json_response)
     if not issue_count:
         # If results are incomplete, retry after 3 min
         time.sleep(360)
+        json_response = get_remote_data(url, accept=GITHUB_ACCEPT)
         issue_count = get_issue_count(json_response)
         if not issue_count:
             # On a second failure, log an error
@@ -5,6 +5,8 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 Get count of milestones data.
+
+Usage: get_count.py MILESTONE [MILESTONE ...]
 """
 
 import datetime
@@ -12,16 +14,18 @@ import json
 import sys
 import sqlalchemy
 import logging
+from urllib.error import URLError
 from urllib.parse import urljoin
-from urllib.request import Request
-from urllib.request import urlopen
 
 from ochazuke import create_app
 from ochazuke.models import db
 from ochazuke.models import IssuesCount
+from tools.helpers import get_remote_data
 
 # Config
 URL_REPO = 'https://api.github.com/repos/webcompat/web-bugs/milestones/'
+URL_ALL_MILESTONES = URL_REPO.rstrip('/') + '?state=all&per_page=100'
+GITHUB_ACCEPT = 'application/vnd.github.v3+json'
 MILESTONES = {
     'non-compat': (1, 'closed'),
     'needstriage': (2, 'open'),
@@ -39,68 +43,89 @@ MILESTONES = {
 LOGGER = logging.getLogger(__name__)
 
 
-def get_remote_file(url):
-    """Request URL."""
-    req = Request(url)
-    req.add_header('User-agent', 'webcompatMonitor')
-    req.add_header('Accept', 'application/vnd.github.v3+json')
-    json_response = urlopen(req, timeout=240)
-    return json_response
-
-
-def extract_issues_count(json_response, status):
-    """Extract the number of open issues."""
+def extract_issues_count(milestone_data, status):
+    """Extract the number of open or closed issues of a milestone."""
     if status == 'open':
         status = 'open_issues'
     else:
         status = 'closed_issues'
-    json_data = json.load(json_response)
-    return json_data[status]
+    return milestone_data[status]
+
+
+def get_milestone_data(number):
+    """Fetch the data of a single milestone."""
+    url = urljoin(URL_REPO, str(number))
+    json_response = get_remote_data(url, accept=GITHUB_ACCEPT)
+    return json.loads(json_response)
+
+
+def get_issues_counts(milestones):
+    """Fetch the issues count of each milestone from GitHub.
+
+    A single milestone is requested on its own. Several milestones are
+    read from one request listing the milestones of the repository, and
+    any milestone missing from that list is then requested on its own.
+    """
+    numbers = {MILESTONES[milestone][0] for milestone in milestones}
+    milestones_by_number = {}
+    if len(numbers) > 1:
+        json_response = get_remote_data(URL_ALL_MILESTONES, accept=GITHUB_ACCEPT)
+        milestones_by_number = {
+            data['number']: data for data in json.loads(json_response)}
+    issues_counts = {}
+    for milestone in milestones:
+        number, status = MILESTONES[milestone]
+        if number not in milestones_by_number:
+            milestones_by_number[number] = get_milestone_data(number)
+        issues_counts[milestone] = extract_issues_count(
+            milestones_by_number[number], status)
+    return issues_counts
 
 
 def newtime(timestamp):
     """convert from local to UTC."""
-    local_time = datetime.datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S")
+    local_time = datetime.datetime.fromisoformat(timestamp)
+    # A naive datetime is taken as local time by astimezone()
+    new_time = local_time.astimezone(datetime.timezone.utc)
     # 2018-02-27T00:00:03Z
-    UTC_OFFSET_TIMEDELTA = datetime.datetime.utcnow() - datetime.datetime.now()
-    new_time = local_time + UTC_OFFSET_TIMEDELTA
     utc_time = new_time.strftime("%Y-%m-%dT%H:%M:%SZ")
     return utc_time
 
 
 def main():
     """Core program."""
-    # Get the milestone we need from the command line.
-    if len(sys.argv) != 2:
-        sys.exit('BYE: too many, too few arguments.')
-    milestone = sys.argv[1]
-    # Check we have the right argument.
-    if milestone in MILESTONES:
-        # make sure the code is a string.
-        urlcode = str(MILESTONES[milestone][0])
-        status = MILESTONES[milestone][1]
-    else:
-        sys.exit('BYE: Not a valid argument.')
+    # Get the milestones we need from the command line.
+    milestones = sys.argv[1:]
+    if not milestones:
+        sys.exit('BYE: too few arguments.')
+    # Check we have the right arguments.
+    for milestone in milestones:
+        if milestone not in MILESTONES:
+            sys.exit('BYE: Not a valid argument.')
     # Extract data from GitHub
-    url = urljoin(URL_REPO, urlcode)
-    json_response = get_remote_file(url)
-    issues_count = extract_issues_count(json_response, status)
+    try:
+        issues_counts = get_issues_counts(milestones)
+    except (URLError, KeyError, ValueError) as error:
+        sys.exit('BYE: Could not fetch the milestones counts: {error}'.format(
+            error=error))
     # Compute the date
     now = newtime(datetime.datetime.now().isoformat(timespec='seconds'))
 
     # Create an app context and store the data in the database
     app = create_app('production')
     with app.app_context():
-        iss_count = IssuesCount(
-            timestamp=now,
-            count=issues_count,
-            milestone=milestone)
-        db.session.add(iss_count)
+        for milestone, issues_count in issues_counts.items():
+            iss_count = IssuesCount(
+                timestamp=now,
+                count=issues_count,
+                milestone=milestone)
+            db.session.add(iss_count)
+        names = ', '.join(issues_counts)
         try:
             db.session.commit()
             msg = ("Successfully wrote MILESTONE {milestone} count for {now} "
                    "to IssuesCount table.").format(
-                milestone=milestone,
+                milestone=names,
                 now=now)
             LOGGER.info(msg)
         # Catch error and attempt to recover by resetting staged changes.
@@ -108,7 +133,7 @@ def main():
             db.session.rollback()
             msg = ("Yikes! Failed to write MILESTONE {milestone} count for "
                    "{now} in IssuesCount table. {error}").format(
-                milestone=milestone,
+                milestone=names,
                 now=now,
                 error=error)
             LOGGER.warning(msg)
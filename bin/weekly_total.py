@@ -11,6 +11,7 @@ import sys
 import logging
 import datetime
 import sqlalchemy
+from sqlalchemy import func
 
 from ochazuke import create_app
 from ochazuke.models import db
@@ -35,27 +36,25 @@ def main():
         sys.exit()
     monday = today - datetime.timedelta(days=7)
     sunday = today - datetime.timedelta(days=1)
-    # Put last Monday and yesterday's dates into format: 2019-01-30
-    monday = monday.isoformat()
-    sunday = sunday.isoformat()
 
     # Create an app context and store the data in the database
     app = create_app("production")
     with app.app_context():
-        date_range = DailyTotal.day.between(monday, sunday)
+        # Up to, not including, today: the whole Sunday is counted
+        date_range = sqlalchemy.and_(DailyTotal.day >= monday, DailyTotal.day < today)
         LOGGER.info("MONDAY: {}".format(monday))
         LOGGER.info("SUNDAY: {}".format(sunday))
         LOGGER.info("DATE_RANGE {}".format(date_range))
-        week_list = DailyTotal.query.filter(date_range).all()
-        LOGGER.info("COUNTS FOR WEEK {}".format(week_list))
-        week_total = 0
-        if not week_list:
+        # Let the database sum the daily counts in a single query
+        week_total = (
+            db.session.query(func.sum(DailyTotal.count)).filter(date_range).scalar()
+        )
+        LOGGER.info("TOTAL FOR WEEK {}".format(week_total))
+        if week_total is None:
             # On a query failure, log an error
             msg = "Weekly count query failed for {}!".format(monday)
             LOGGER.warning(msg)
             return
-        for day in week_list:
-            week_total += day.count
         weekly_count = WeeklyTotal(monday=monday, count=week_total)
         db.session.add(weekly_count)
         try:
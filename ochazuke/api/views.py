@@ -24,6 +24,13 @@ from ochazuke.helpers import normalize_date_range
 from tools.helpers import get_remote_data
 from tools.helpers import url_with_params
 
+# Headers sent along every JSON response of the API.
+CORS_HEADERS = (
+    ("Access-Control-Allow-Origin", "*"),
+    ("Access-Control-Allow-Credentials", "true"),
+    ("Vary", "Origin"),
+)
+
 
 @api_blueprint.route("/weekly-counts")
 def weekly_reports_data():
@@ -49,10 +56,8 @@ def weekly_reports_data():
         response=json.dumps(response_object),
         status=200,
         mimetype="application/json",
+        headers=CORS_HEADERS,
     )
-    response.headers.add("Access-Control-Allow-Origin", "*")
-    response.headers.add("Access-Control-Allow-Credentials", "true")
-    response.headers.add("Vary", "Origin")
     return response
 
 
@@ -82,10 +87,8 @@ def issues_count_data(category):
         response=json.dumps(response_object),
         status=200,
         mimetype="application/json",
+        headers=CORS_HEADERS,
     )
-    response.headers.add("Access-Control-Allow-Origin", "*")
-    response.headers.add("Access-Control-Allow-Credentials", "true")
-    response.headers.add("Vary", "Origin")
     return response
 
 
@@ -93,13 +96,13 @@ def issues_count_data(category):
 def triage_bugs():
     """Returns the list of issues which are currently in triage."""
     url = "https://api.github.com/repos/webcompat/web-bugs/issues?sort=created&per_page=100&direction=asc&milestone=2"  # noqa
-    json_data = get_remote_data(url)
+    json_data = get_remote_data(url, conditional=True)
     response = Response(
-        response=json_data, status=200, mimetype="application/json"
+        response=json_data,
+        status=200,
+        mimetype="application/json",
+        headers=CORS_HEADERS,
     )
-    response.headers.add("Access-Control-Allow-Origin", "*")
-    response.headers.add("Access-Control-Allow-Credentials", "true")
-    response.headers.add("Vary", "Origin")
     return response
 
 
@@ -107,13 +110,13 @@ def triage_bugs():
 def tsci_doc():
     """Returns the current ID of the spreadsheet where TSCI is calculated."""
     url = "https://tsci.webcompat.com/currentDoc.json"  # noqa
-    json_data = get_remote_data(url)
+    json_data = get_remote_data(url, conditional=True)
     response = Response(
-        response=json_data, status=200, mimetype="application/json"
+        response=json_data,
+        status=200,
+        mimetype="application/json",
+        headers=CORS_HEADERS,
     )
-    response.headers.add("Access-Control-Allow-Origin", "*")
-    response.headers.add("Access-Control-Allow-Credentials", "true")
-    response.headers.add("Vary", "Origin")
     return response
 
 
@@ -134,9 +137,9 @@ def firefox_interventions():
     except HTTPError:
         json_data = "[]"
     response = Response(
-        response=json_data, status=200, mimetype="application/json"
+        response=json_data,
+        status=200,
+        mimetype="application/json",
+        headers=CORS_HEADERS,
     )
-    response.headers.add("Access-Control-Allow-Origin", "*")
-    response.headers.add("Access-Control-Allow-Credentials", "true")
-    response.headers.add("Vary", "Origin")
     return response
@@ -12,6 +12,16 @@ from ochazuke import logging
 from ochazuke.models import IssuesCount
 from ochazuke.models import WeeklyTotal
 
+VALID_CATEGORIES = frozenset(
+    [
+        "needsdiagnosis",
+        "needstriage",
+        "needscontact",
+        "contactready",
+        "sitewait",
+    ]
+)
+
 
 def get_days(from_date, to_date):
     """Create the list of dates spanning two dates.
@@ -83,16 +93,7 @@ def is_valid_args(args):
 
 def is_valid_category(category):
     """Check if the category is acceptable."""
-    VALID_CATEGORY = [
-        "needsdiagnosis",
-        "needstriage",
-        "needscontact",
-        "contactready",
-        "sitewait",
-    ]
-    if category in VALID_CATEGORY:
-        return True
-    return False
+    return category in VALID_CATEGORIES
 
 
 def normalize_date_range(from_date, to_date):
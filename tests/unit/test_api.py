@@ -4,13 +4,13 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """Main testing module for Webcompat Metrics Server."""
+import functools
 import json
 import os
 import unittest
 from unittest.mock import patch
 
 from ochazuke import create_app
-from ochazuke import db
 
 
 DATA = [
@@ -27,34 +27,53 @@ WEEKLY_DATA = [
 
 TSCI_ID = [{"currentDoc": "8sXj8GqhrdJhQdLk44"}]
 
+FIXTURES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures"
+)
 
+
+@functools.lru_cache(maxsize=None)
 def json_data(filename):
-    """Return a tuple with the content and its signature."""
-    current_root = os.path.realpath(os.curdir)
-    fixtures_path = "tests/fixtures"
-    path = os.path.join(current_root, fixtures_path, filename)
+    """Return the raw JSON content of a fixture file."""
+    path = os.path.join(FIXTURES_PATH, filename)
     with open(path, "r") as f:
-        json_event = json.dumps(json.load(f))
-    return json_event
+        return f.read()
 
 
 class APITestCase(unittest.TestCase):
     """General Test Cases for views."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the app once for all tests.
+
+        Each test either patches data access or aborts before any query,
+        so no DB schema is needed.
+        """
+        cls.app = create_app("testing")
+        cls.client = cls.app.test_client()
+
     def setUp(self):
         """Set up tests."""
-        self.app = create_app("testing")
         self.app_context = self.app.app_context()
         self.app_context.push()
-        db.create_all()
-        # Initialize a DB?
-        self.client = self.app.test_client()
 
     def tearDown(self):
-        db.session.remove()
-        db.drop_all()
         self.app_context.pop()
 
+    def assert_json_cors_response(self, rv):
+        """Check a successful JSON response with its CORS headers."""
+        self.assertEqual(rv.status_code, 200)
+        self.assertEqual(rv.mimetype, "application/json")
+        self.assertIn("Access-Control-Allow-Origin", rv.headers)
+        self.assertEqual("*", rv.headers["Access-Control-Allow-Origin"])
+        self.assertIn("Vary", rv.headers)
+        self.assertEqual("Origin", rv.headers["Vary"])
+        self.assertIn("Access-Control-Allow-Credentials", rv.headers)
+        self.assertEqual(
+            "true", rv.headers["Access-Control-Allow-Credentials"]
+        )
+
     @patch("ochazuke.api.views.get_weekly_data")
     def test_weeklydata(self, mock_get):
         """Send back on /data/weekly-counts a JSON."""
@@ -66,18 +85,7 @@ class APITestCase(unittest.TestCase):
             ('{"count": 392, "timestamp": "2019-05-27T00:00:00Z"}'),
             rv.data.decode(),
         )
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(rv.mimetype, "application/json")
-        self.assertTrue("Access-Control-Allow-Origin" in rv.headers.keys())
-        self.assertEqual("*", rv.headers["Access-Control-Allow-Origin"])
-        self.assertTrue("Vary" in rv.headers.keys())
-        self.assertEqual("Origin", rv.headers["Vary"])
-        self.assertTrue(
-            "Access-Control-Allow-Credentials" in rv.headers.keys()
-        )
-        self.assertEqual(
-            "true", rv.headers["Access-Control-Allow-Credentials"]
-        )
+        self.assert_json_cors_response(rv)
 
     @patch("ochazuke.api.views.get_timeline_data")
     def test_needsdiagnosis_valid_param(self, mock_timeline):
@@ -92,39 +100,18 @@ class APITestCase(unittest.TestCase):
         self.assertIn(
             '"about": "Hourly needsdiagnosis issues count"', rv.data.decode()
         )
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(rv.mimetype, "application/json")
-        self.assertTrue("Access-Control-Allow-Origin" in rv.headers.keys())
-        self.assertEqual("*", rv.headers["Access-Control-Allow-Origin"])
-        self.assertTrue("Vary" in rv.headers.keys())
-        self.assertEqual("Origin", rv.headers["Vary"])
-        self.assertTrue(
-            "Access-Control-Allow-Credentials" in rv.headers.keys()
-        )
-        self.assertEqual(
-            "true", rv.headers["Access-Control-Allow-Credentials"]
-        )
+        self.assert_json_cors_response(rv)
 
     @patch("ochazuke.api.views.get_remote_data")
     def test_triage_stats(self, mock_get):
         """/data/triage-bugs sends back JSON."""
         mock_get.return_value = json_data("triage.json")
         rv = self.client.get("/data/triage-bugs")
+        self.assertTrue(mock_get.call_args.kwargs["conditional"])
         self.assertIn(
             '"title": "example.org - dashboard test"', rv.data.decode()
         ),
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(rv.mimetype, "application/json")
-        self.assertTrue("Access-Control-Allow-Origin" in rv.headers.keys())
-        self.assertEqual("*", rv.headers["Access-Control-Allow-Origin"])
-        self.assertTrue("Vary" in rv.headers.keys())
-        self.assertEqual("Origin", rv.headers["Vary"])
-        self.assertTrue(
-            "Access-Control-Allow-Credentials" in rv.headers.keys()
-        )
-        self.assertEqual(
-            "true", rv.headers["Access-Control-Allow-Credentials"]
-        )
+        self.assert_json_cors_response(rv)
 
     @patch("ochazuke.api.views.get_remote_data")
     def test_tsci_id(self, mock_get):
@@ -132,18 +119,7 @@ class APITestCase(unittest.TestCase):
         mock_get.return_value = json.dumps(TSCI_ID)
         rv = self.client.get("/data/tsci-doc")
         self.assertIn('"currentDoc": "8sXj8GqhrdJhQdLk44"', rv.data.decode())
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(rv.mimetype, "application/json")
-        self.assertTrue("Access-Control-Allow-Origin" in rv.headers.keys())
-        self.assertEqual("*", rv.headers["Access-Control-Allow-Origin"])
-        self.assertTrue("Vary" in rv.headers.keys())
-        self.assertEqual("Origin", rv.headers["Vary"])
-        self.assertTrue(
-            "Access-Control-Allow-Credentials" in rv.headers.keys()
-        )
-        self.assertEqual(
-            "true", rv.headers["Access-Control-Allow-Credentials"]
-        )
+        self.assert_json_cors_response(rv)
 
     def test_needsdiagnosis_without_params(self):
         """/data/needsdiagnosis-timeline without params fail."""
@@ -161,22 +137,12 @@ class APITestCase(unittest.TestCase):
         self.assertEqual(rv.status_code, 404)
 
     @patch("ochazuke.api.views.get_remote_data")
-    def firefox_interventions(self, mock_get):
-        """/data/triage-bugs sends back JSON."""
+    def test_firefox_interventions(self, mock_get):
+        """/data/firefox-interventions sends back JSON."""
         mock_get.return_value = json_data("firefox-interventions.json")
         rv = self.client.get("/data/firefox-interventions?distribution=upstream&type=all&end=2020-01-01") # noqa
-        self.assertEqual(rv.status_code, 200)
-        self.assertEqual(rv.mimetype, "application/json")
-        self.assertTrue("Access-Control-Allow-Origin" in rv.headers.keys())
-        self.assertEqual("*", rv.headers["Access-Control-Allow-Origin"])
-        self.assertTrue("Vary" in rv.headers.keys())
-        self.assertEqual("Origin", rv.headers["Vary"])
-        self.assertTrue(
-            "Access-Control-Allow-Credentials" in rv.headers.keys()
-        )
-        self.assertEqual(
-            "true", rv.headers["Access-Control-Allow-Credentials"]
-        )
+        self.assertIn('"datetime": "2020-01-01T00:00:39.937Z"', rv.data.decode())
+        self.assert_json_cors_response(rv)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""Testing module for the bin/daily_total.py script."""
+import importlib.util
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+BIN_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "bin",
+    "daily_total.py",
+)
+spec = importlib.util.spec_from_file_location("daily_total", BIN_PATH)
+daily_total = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(daily_total)
+
+COMPLETE = json.dumps({"incomplete_results": False, "total_count": 42}).encode()
+INCOMPLETE = json.dumps({"incomplete_results": True, "total_count": 12}).encode()
+
+
+@patch.object(daily_total.time, "sleep")
+@patch.object(daily_total, "db")
+@patch.object(daily_total, "create_app")
+@patch.object(daily_total, "get_remote_data")
+class DailyTotalTestCase(unittest.TestCase):
+    """Test Cases for storing the daily total of reported issues."""
+
+    def test_complete_results(self, mock_get, mock_app, mock_db, mock_sleep):
+        """Complete search results are stored right away."""
+        mock_get.return_value = COMPLETE
+        daily_total.main()
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_called()
+        total = mock_db.session.add.call_args.args[0]
+        self.assertEqual(total.count, 42)
+        mock_db.session.commit.assert_called_once_with()
+
+    def test_incomplete_then_complete(
+            self, mock_get, mock_app, mock_db, mock_sleep):
+        """Incomplete search results are fetched again before storing."""
+        mock_get.side_effect = [INCOMPLETE, COMPLETE]
+        daily_total.main()
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once_with(360)
+        total = mock_db.session.add.call_args.args[0]
+        self.assertEqual(total.count, 42)
+        mock_db.session.commit.assert_called_once_with()
+
+    def test_incomplete_twice(self, mock_get, mock_app, mock_db, mock_sleep):
+        """Two incomplete search results log a warning and store nothing."""
+        mock_get.return_value = INCOMPLETE
+        with self.assertLogs(daily_total.LOGGER, "WARNING"):
+            daily_total.main()
+        self.assertEqual(mock_get.call_count, 2)
+        mock_app.assert_not_called()
+        mock_db.session.add.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""Testing module for the bin/get_count.py script."""
+import importlib.util
+import json
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+BIN_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "bin",
+    "get_count.py",
+)
+spec = importlib.util.spec_from_file_location("get_count", BIN_PATH)
+get_count = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(get_count)
+
+MILESTONES_DATA = [
+    {"number": 3, "open_issues": 30, "closed_issues": 3},
+    {"number": 12, "open_issues": 0, "closed_issues": 120},
+]
+
+
+def fake_remote_data(milestones_data):
+    """Serve the list endpoint and single milestone endpoints."""
+    def remote_data(url, accept):
+        if url == get_count.URL_ALL_MILESTONES:
+            return json.dumps(milestones_data).encode()
+        number = int(url.rsplit("/", 1)[1])
+        for data in MILESTONES_DATA:
+            if data["number"] == number:
+                return json.dumps(data).encode()
+        raise HTTPError(url, 404, "Not Found", {}, None)
+    return remote_data
+
+
+class GetCountTestCase(unittest.TestCase):
+    """Test Cases for fetching milestones counts."""
+
+    @patch.object(get_count, "get_remote_data")
+    def test_single_milestone(self, mock_get):
+        """One milestone is fetched from its own endpoint."""
+        mock_get.side_effect = fake_remote_data(MILESTONES_DATA)
+        counts = get_count.get_issues_counts(["needsdiagnosis"])
+        self.assertEqual(counts, {"needsdiagnosis": 30})
+        mock_get.assert_called_once_with(
+            get_count.URL_REPO + "3", accept=get_count.GITHUB_ACCEPT)
+
+    @patch.object(get_count, "get_remote_data")
+    def test_several_milestones(self, mock_get):
+        """Several milestones are read from one list request."""
+        mock_get.side_effect = fake_remote_data(MILESTONES_DATA)
+        counts = get_count.get_issues_counts(["needsdiagnosis", "fixed"])
+        self.assertEqual(counts, {"needsdiagnosis": 30, "fixed": 120})
+        mock_get.assert_called_once_with(
+            get_count.URL_ALL_MILESTONES, accept=get_count.GITHUB_ACCEPT)
+
+    @patch.object(get_count, "get_remote_data")
+    def test_milestone_missing_from_list(self, mock_get):
+        """A milestone missing from the list is fetched on its own."""
+        mock_get.side_effect = fake_remote_data(MILESTONES_DATA[:1])
+        counts = get_count.get_issues_counts(["needsdiagnosis", "fixed"])
+        self.assertEqual(counts, {"needsdiagnosis": 30, "fixed": 120})
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(get_count, "db")
+    @patch.object(get_count, "create_app")
+    @patch.object(get_count, "get_remote_data")
+    def test_main_stores_counts(self, mock_get, mock_app, mock_db):
+        """One IssuesCount row is added per milestone, in a single commit."""
+        mock_get.side_effect = fake_remote_data(MILESTONES_DATA)
+        argv = ["get_count.py", "needsdiagnosis", "fixed"]
+        with patch.object(sys, "argv", argv):
+            get_count.main()
+        mock_app.assert_called_once_with("production")
+        added = [c.args[0] for c in mock_db.session.add.call_args_list]
+        self.assertEqual(
+            sorted((row.milestone, row.count) for row in added),
+            [("fixed", 120), ("needsdiagnosis", 30)])
+        mock_db.session.commit.assert_called_once_with()
+
+    @patch.object(get_count, "get_remote_data")
+    def test_fetch_failure_exits(self, mock_get):
+        """Exit with a BYE message when GitHub answers 404 for a milestone."""
+        mock_get.side_effect = fake_remote_data(MILESTONES_DATA)
+        with patch.object(sys, "argv", ["get_count.py", "sitewait", "fixed"]):
+            with self.assertRaises(SystemExit) as cm:
+                get_count.main()
+        self.assertTrue(str(cm.exception.code).startswith("BYE: "))
+
+
+class NewtimeTestCase(unittest.TestCase):
+    """Test Cases for the local to UTC time conversion."""
+
+    def set_timezone(self, timezone):
+        """Run the test in a given local timezone."""
+        previous = os.environ.get("TZ")
+
+        def restore():
+            if previous is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = previous
+            time.tzset()
+
+        self.addCleanup(restore)
+        os.environ["TZ"] = timezone
+        time.tzset()
+
+    def test_newtime_utc(self):
+        """A local time in UTC is returned as is, with a Z suffix."""
+        self.set_timezone("UTC")
+        self.assertEqual(
+            get_count.newtime("2018-05-11T10:11:08"), "2018-05-11T10:11:08Z")
+
+    def test_newtime_summer(self):
+        """A summer local time uses the daylight saving offset."""
+        self.set_timezone("America/Montreal")
+        self.assertEqual(
+            get_count.newtime("2018-07-11T22:11:08"), "2018-07-12T02:11:08Z")
+
+    def test_newtime_winter(self):
+        """A winter local time uses the standard offset."""
+        self.set_timezone("America/Montreal")
+        self.assertEqual(
+            get_count.newtime("2018-01-11T22:11:08"), "2018-01-12T03:11:08Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
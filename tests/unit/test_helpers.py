@@ -22,12 +22,15 @@ DATA = [{"count": "485", "timestamp": "2018-05-15T01:00:00Z"},
 class HelpersTestCase(unittest.TestCase):
     """General Test Cases for helpers."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the app once for all tests."""
+        cls.app = create_app('testing')
+
     def setUp(self):
         """Set up tests."""
-        self.app = create_app('testing')
         self.app_context = self.app.app_context()
         self.app_context.push()
-        self.client = self.app.test_client()
 
     def tearDown(self):
         self.app_context.pop()
@@ -68,25 +71,35 @@ class HelpersTestCase(unittest.TestCase):
 
     def test_is_valid_args(self):
         """Return True or False depending on the args."""
-        self.assertTrue(helpers.is_valid_args(ImmutableMultiDict(
-            [('from', '2018-05-16'), ('to', '2018-05-18')])))
-        self.assertFalse(helpers.is_valid_args(ImmutableMultiDict([])))
-        self.assertFalse(helpers.is_valid_args(ImmutableMultiDict(
-            [('bar', 'foo')])))
-        self.assertFalse(helpers.is_valid_args(ImmutableMultiDict(
-            [('from', 'bar'), ('to', 'foo')])))
+        cases = [
+            ([('from', '2018-05-16'), ('to', '2018-05-18')], True),
+            ([], False),
+            ([('bar', 'foo')], False),
+            ([('from', 'bar'), ('to', 'foo')], False),
+        ]
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(
+                    helpers.is_valid_args(ImmutableMultiDict(args)), expected)
+
+    def test_is_valid_category(self):
+        """Accept only the known milestone categories."""
+        self.assertTrue(helpers.is_valid_category('needsdiagnosis'))
+        self.assertTrue(helpers.is_valid_category('sitewait'))
+        self.assertFalse(helpers.is_valid_category('non-compat'))
+        self.assertFalse(helpers.is_valid_category(''))
 
     def test_normalize_date_range(self):
         """Test dates normalization."""
-        self.assertEqual(
-            helpers.normalize_date_range('2019-01-01', '2019-01-03'),
-            ('2019-01-01', '2019-01-04'))
-        self.assertEqual(
-            helpers.normalize_date_range('not_date', '2019-01-03'),
-            None)
-        self.assertEqual(
-            helpers.normalize_date_range('2019-01-01', '2019-01-01'),
-            ('2019-01-01', '2019-01-02'))
+        cases = [
+            (('2019-01-01', '2019-01-03'), ('2019-01-01', '2019-01-04')),
+            (('not_date', '2019-01-03'), None),
+            (('2019-01-01', '2019-01-01'), ('2019-01-01', '2019-01-02')),
+        ]
+        for dates, expected in cases:
+            with self.subTest(dates=dates):
+                self.assertEqual(
+                    helpers.normalize_date_range(*dates), expected)
 
 
 if __name__ == '__main__':
@@ -4,7 +4,10 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """Main testing module for Webcompat Metrics Server."""
+import gzip
 import unittest
+from unittest.mock import patch
+from urllib.error import HTTPError
 
 from tools import helpers
 
@@ -12,6 +15,10 @@ from tools import helpers
 class ToolsHelpersTestCase(unittest.TestCase):
     """General Test Cases for global helpers."""
 
+    def setUp(self):
+        """Start each test without any cached ETag."""
+        helpers.ETAG_CACHE.clear()
+
     def test_url_with_params(self):
         """Given a dict of parameters and a URL, returns an encoded URL."""
         url = "https://example.com/test"
@@ -23,6 +30,94 @@ class ToolsHelpersTestCase(unittest.TestCase):
 
         self.assertEqual(helpers.url_with_params(url, parameters), expected)
 
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_gzip(self, mock_urlopen):
+        """Ask for gzip and return the decompressed body."""
+        body = b'[{"currentDoc": "8sXj8GqhrdJhQdLk44"}]'
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = gzip.compress(body)
+        response.headers = {'Content-Encoding': 'gzip'}
+        self.assertEqual(helpers.get_remote_data('https://example.com/'), body)
+        req = mock_urlopen.call_args[0][0]
+        self.assertEqual(req.get_header('Accept-encoding'), 'gzip')
+
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_identity(self, mock_urlopen):
+        """Return the body as is when the server did not compress it."""
+        body = b'[{"currentDoc": "8sXj8GqhrdJhQdLk44"}]'
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = body
+        response.headers = {}
+        self.assertEqual(helpers.get_remote_data('https://example.com/'), body)
+
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_accept(self, mock_urlopen):
+        """Send the requested Accept header, JSON by default."""
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = b'[]'
+        response.headers = {}
+        helpers.get_remote_data('https://example.com/')
+        req = mock_urlopen.call_args[0][0]
+        self.assertEqual(req.get_header('Accept'), 'application/json')
+        github_json = 'application/vnd.github.v3+json'
+        helpers.get_remote_data('https://example.com/', accept=github_json)
+        req = mock_urlopen.call_args[0][0]
+        self.assertEqual(req.get_header('Accept'), github_json)
+
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_not_modified(self, mock_urlopen):
+        """Send If-None-Match and reuse the cached body on a 304."""
+        url = 'https://example.com/'
+        body = b'[{"currentDoc": "8sXj8GqhrdJhQdLk44"}]'
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = body
+        response.headers = {'ETag': '"abc"'}
+        self.assertEqual(helpers.get_remote_data(url, conditional=True), body)
+        mock_urlopen.side_effect = HTTPError(url, 304, 'Not Modified', {}, None)
+        self.assertEqual(helpers.get_remote_data(url, conditional=True), body)
+        req = mock_urlopen.call_args[0][0]
+        self.assertEqual(req.get_header('If-none-match'), '"abc"')
+
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_cache_size(self, mock_urlopen):
+        """Keep at most ETAG_CACHE_SIZE URLs in the ETag cache."""
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = b'[]'
+        response.headers = {'ETag': '"abc"'}
+        with patch('tools.helpers.ETAG_CACHE_SIZE', 2):
+            for n in range(3):
+                helpers.get_remote_data(
+                    'https://example.com/{}'.format(n), conditional=True)
+        self.assertEqual(
+            list(helpers.ETAG_CACHE),
+            [('https://example.com/1', 'application/json'),
+             ('https://example.com/2', 'application/json')])
+
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_etag_per_accept(self, mock_urlopen):
+        """Do not reuse an ETag received for another Accept header."""
+        url = 'https://example.com/'
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = b'[]'
+        response.headers = {'ETag': '"abc"'}
+        helpers.get_remote_data(url, conditional=True)
+        github_json = 'application/vnd.github.v3+json'
+        helpers.get_remote_data(url, accept=github_json, conditional=True)
+        req = mock_urlopen.call_args[0][0]
+        self.assertIsNone(req.get_header('If-none-match'))
+
+    @patch('tools.helpers.urlopen')
+    def test_get_remote_data_not_conditional(self, mock_urlopen):
+        """Do not cache responses unless the request is conditional."""
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.return_value = b'[]'
+        response.headers = {'ETag': '"abc"'}
+        helpers.get_remote_data('https://example.com/')
+        helpers.get_remote_data('https://example.com/')
+        req = mock_urlopen.call_args[0][0]
+        self.assertIsNone(req.get_header('If-none-match'))
+        self.assertEqual(helpers.ETAG_CACHE, {})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,12 +12,16 @@ from ochazuke import create_app
 class WebTestCase(unittest.TestCase):
     """General Test Cases for views."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the app once for all tests."""
+        cls.app = create_app('testing')
+        cls.client = cls.app.test_client()
+
     def setUp(self):
         """Set up tests."""
-        self.app = create_app('testing')
         self.app_context = self.app.app_context()
         self.app_context.push()
-        self.client = self.app.test_client()
 
     def tearDown(self):
         self.app_context.pop()
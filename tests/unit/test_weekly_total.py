@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""Testing module for the bin/weekly_total.py script."""
+import datetime
+import importlib.util
+import os
+import unittest
+from unittest.mock import patch
+
+from ochazuke import create_app
+from ochazuke.models import db
+from ochazuke.models import DailyTotal
+from ochazuke.models import WeeklyTotal
+
+BIN_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "bin",
+    "weekly_total.py",
+)
+spec = importlib.util.spec_from_file_location("weekly_total", BIN_PATH)
+weekly_total = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(weekly_total)
+
+# The script runs on Monday 2019-02-04 for the week of 2019-01-28.
+TODAY = datetime.date(2019, 2, 4)
+MONDAY = datetime.datetime(2019, 1, 28)
+
+
+class WeeklyTotalTestCase(unittest.TestCase):
+    """Test Cases for storing the weekly total of reported issues."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the app once for all tests."""
+        cls.app = create_app("testing")
+
+    def setUp(self):
+        """Set up tests."""
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        patcher = patch.object(weekly_total, "datetime")
+        mock_datetime = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_datetime.date.today.return_value = TODAY
+        mock_datetime.timedelta = datetime.timedelta
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def run_main(self):
+        """Run the script against the test database."""
+        with patch.object(weekly_total, "create_app", return_value=self.app):
+            weekly_total.main()
+
+    def test_weekly_total(self):
+        """The daily counts of the past week are summed and stored."""
+        for days, count in [(-1, 1000), (0, 10), (3, 20), (6, 30), (7, 2000)]:
+            day = MONDAY + datetime.timedelta(days=days)
+            db.session.add(DailyTotal(day=day, count=count))
+        db.session.commit()
+        self.run_main()
+        weekly = WeeklyTotal.query.one()
+        self.assertEqual(weekly.monday, MONDAY)
+        self.assertEqual(weekly.count, 60)
+
+    def test_empty_week(self):
+        """A week without daily counts stores nothing."""
+        with self.assertLogs(weekly_total.LOGGER, "WARNING"):
+            self.run_main()
+        self.assertEqual(WeeklyTotal.query.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
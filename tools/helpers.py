@@ -5,17 +5,58 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """Some helpers for the tools section."""
 
+import gzip
+import threading
+from urllib.error import HTTPError
 from urllib.parse import urlencode
 from urllib.request import Request
 from urllib.request import urlopen
 
+# Last ETag and body received for a (URL, Accept) pair, used for
+# conditional requests. Only fixed URLs should opt in, as every cached
+# body stays in memory for the life of the process. The lock keeps it
+# safe with threaded workers.
+ETAG_CACHE = {}
+ETAG_CACHE_SIZE = 128
+ETAG_CACHE_LOCK = threading.Lock()
 
-def get_remote_data(url):
-    """Request URL."""
+
+def get_remote_data(url, accept='application/json', conditional=False):
+    """Request URL.
+
+    The body is requested gzip-compressed and decompressed on arrival.
+    With conditional=True, the ETag and body of the response are cached.
+    If the URL answered with an ETag before for the same Accept header,
+    the request is then conditional and a 304 Not Modified returns the
+    previously received body. Leave it off for URLs built from user input.
+    """
     req = Request(url)
     req.add_header('User-agent', 'webcompatMonitor')
-    req.add_header('Accept', 'application/json')
-    json_response = urlopen(req, timeout=240).read()
+    req.add_header('Accept', accept)
+    req.add_header('Accept-Encoding', 'gzip')
+    cache_key = (url, accept)
+    cached = None
+    if conditional:
+        with ETAG_CACHE_LOCK:
+            cached = ETAG_CACHE.get(cache_key)
+    if cached:
+        req.add_header('If-None-Match', cached[0])
+    try:
+        with urlopen(req, timeout=240) as response:
+            json_response = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                json_response = gzip.decompress(json_response)
+            etag = response.headers.get('ETag')
+    except HTTPError as error:
+        if cached and error.code == 304:
+            return cached[1]
+        raise
+    if conditional and etag:
+        with ETAG_CACHE_LOCK:
+            if cache_key not in ETAG_CACHE and len(ETAG_CACHE) >= ETAG_CACHE_SIZE:
+                # Drop the oldest entry to keep the cache bounded.
+                del ETAG_CACHE[next(iter(ETAG_CACHE))]
+            ETAG_CACHE[cache_key] = (etag, json_response)
     return json_response
 
 